@@ -1,3 +1,5 @@
+import atexit
+import functools
 import os
 import sys
 from concurrent.futures import ThreadPoolExecutor
@@ -7,14 +9,10 @@ from typing_extensions import Literal
 
 from inspec_core import options
 from inspec_core.colormaps import get_colormap, valid_colormaps
-from inspec_core.components.live_audio_view import (
-    LiveAudioComponent,
-    LiveAudioViewState,
-)
 from inspec_core.components.size import Size
 from inspec_core.render import make_intensity_renderer, make_rgb_renderer
 from inspec_core.render.display import display
-from inspec_core.render.types import CharShape
+from inspec_core.render.types import CharShape, ColoredCharArray
 
 # Set Console Mode so that ANSI codes will work
 if sys.platform == "win32":
@@ -24,6 +22,23 @@ if sys.platform == "win32":
     kernel32.SetConsoleMode(kernel32.GetStdHandle(-11), 7)
 
 
+def _fit_size(
+    width: Optional[int], height: Optional[int], chars: CharShape
+) -> Size.Size:
+    """
+    Size for an image-like view: fixed in whichever dimensions are given, otherwise as
+    large as fits in the terminal while keeping the aspect ratio
+    """
+    if width and height:
+        return Size.FixedSize(width=width, height=height)
+    elif width:
+        return Size.FixedWidth(width=width)
+    elif height:
+        return Size.FixedHeight(height=height)
+    else:
+        return Size.MaxSize.fill_terminal(shape=chars)
+
+
 def imshow(
     filename: str,
     height: Optional[int] = None,
@@ -33,21 +48,39 @@ def imshow(
     from inspec_core.components.image_view import ImageReader, ImageViewState
 
     reader = ImageReader(filename=filename)
-    size = (
-        Size.FixedSize(width=width, height=height)
-        if width and height
-        else Size.FixedWidth(width=width)
-        if width
-        else Size.FixedHeight(height=height)
-        if height
-        else Size.MaxSize.fill_terminal(shape=chars)
-    )
+    size = _fit_size(width, height, chars)
     view = ImageViewState()
     renderer = make_rgb_renderer(shape=chars)
     arr = reader.get_view(view, size)
     display(renderer.apply(arr))
 
 
+def imshow_many(
+    filenames: list[str],
+    height: Optional[int] = None,
+    width: Optional[int] = None,
+    chars: Literal[CharShape.Full, CharShape.Half] = CharShape.Full,
+):
+    """
+    Print several images one after another
+
+    The images are read and rendered on a thread pool (PIL and numpy release the GIL for
+    most of that), and only printing happens in order on this thread.
+    """
+    from inspec_core.components.image_view import ImageReader, ImageViewState
+
+    size = _fit_size(width, height, chars)
+    view = ImageViewState()
+    renderer = make_rgb_renderer(shape=chars)
+
+    def render(filename: str) -> ColoredCharArray:
+        return renderer.apply(ImageReader(filename=filename).get_view(view, size))
+
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for char_array in executor.map(render, filenames):
+            display(char_array)
+
+
 def ashow(
     filename: str,
     height: Optional[int] = None,
@@ -92,15 +125,7 @@ def vshow(
         VideoViewState,
     )
 
-    size = (
-        Size.FixedSize(width=width, height=height)
-        if width and height
-        else Size.FixedWidth(width=width)
-        if width
-        else Size.FixedHeight(height=height)
-        if height
-        else Size.MaxSize.fill_terminal(shape=chars)
-    )
+    size = _fit_size(width, height, chars)
     view = VideoViewState(frame=frame)
     if mode is options.VideoMode.Greyscale:
         try:
@@ -120,6 +145,16 @@ def vshow(
     display(renderer.apply(arr))
 
 
+@functools.lru_cache(maxsize=None)
+def _live_audio_executor() -> ThreadPoolExecutor:
+    """
+    A single worker thread shared by every listen() call, instead of one leaked per call
+    """
+    executor = ThreadPoolExecutor(max_workers=1)
+    atexit.register(executor.shutdown, wait=False)
+    return executor
+
+
 async def listen(
     channel: int = 0,
     width: Optional[int] = None,
@@ -128,7 +163,12 @@ async def listen(
     cmap: str = "viridis",
     chars: CharShape = CharShape.Full,
 ):
-    component = LiveAudioComponent(executor=ThreadPoolExecutor(max_workers=1))
+    from inspec_core.components.live_audio_view import (
+        LiveAudioComponent,
+        LiveAudioViewState,
+    )
+
+    component = LiveAudioComponent(executor=_live_audio_executor())
 
     size = Size.FixedSize(
         height=width or os.get_terminal_size().columns,  # 'width'
@@ -152,6 +192,7 @@ __all__ = [
     "CharShape",
     "ashow",
     "imshow",
+    "imshow_many",
     "get_colormap",
     "listen",
     "options",
@@ -1,7 +1,13 @@
 import abc
 import asyncio
 import curses
+import functools
+import multiprocessing
 import os
+import sys
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import Generic, Optional, Type, TypeVar
 
 import pydantic
@@ -10,10 +16,11 @@ from inspec_core.colormaps import get_colormap
 from inspec_core.components.audio_view import AudioReader, AudioViewState
 from inspec_core.components.base_view import ViewT
 from inspec_core.components.image_view import GreyscaleImageReader, ImageViewState
+from inspec_core.components.size import Size
 from inspec_core.components.video_view import GreyscaleVideoFrameReader, VideoViewState
 from inspec_core.inspec_curses import context
 from inspec_core.render.renderer import Renderer, make_intensity_renderer
-from inspec_core.render.types import RGB, CharShape, Intensity
+from inspec_core.render.types import RGB, CharShape, ColoredCharArray, Intensity
 
 from . import draw, events, key_handlers
 from .paginate import GridPaginator
@@ -52,11 +59,19 @@ class VideoComponentView(
 SupportedComponent = AudioComponentView | ImageComponentView | VideoComponentView
 
 
-class GridState(pydantic.BaseModel):
+@dataclass(frozen=True, slots=True)
+class GridState:
     rows: int = 1
     cols: int = 1
 
 
+@functools.lru_cache(maxsize=None)
+def _grid_paginator(grid: GridState) -> GridPaginator:
+    # The paginator is looked up several times per key event; there are only ever a
+    # handful of grid sizes, so share one per size instead of constructing it each time
+    return GridPaginator(rows=grid.rows, cols=grid.cols)
+
+
 class PanelAppState(pydantic.BaseModel):
     grid: GridState = GridState()
     current_page: int = 0
@@ -71,35 +86,87 @@ class PanelAppState(pydantic.BaseModel):
 
     @property
     def paginator(self) -> GridPaginator:
-        return GridPaginator(
-            rows=self.grid.rows,
-            cols=self.grid.cols,
-        )
+        return _grid_paginator(self.grid)
 
 
 def render_component(
-    window: curses.window,
+    size: Size.FixedSize,
     component: SupportedComponent,
     renderer: Renderer[Intensity],
-) -> None:
-    size = draw.size_from_window(window)
-    size.height *= renderer.scale().height
-    size.width *= renderer.scale().width
+) -> ColoredCharArray:
+    """
+    Render a component to characters filling a window of the given size
 
-    context.display(
-        window,
-        renderer.apply(
-            # This call works as long as we ensure that the component file_ and state types align.
-            component.file_.get_view(component.state, size),  # type: ignore
-        ),
+    Does not touch curses, so it can be run in a worker thread.
+    """
+    size = Size.FixedSize(
+        width=size.width * renderer.scale().width,
+        height=size.height * renderer.scale().height,
+    )
+    return renderer.apply(
+        # This call works as long as we ensure that the component file_ and state types align.
+        component.file_.get_view(component.state, size),  # type: ignore
     )
 
 
+class RenderCache:
+    """
+    The last characters rendered for the most recently drawn components
+
+    They are reused while the component's view state and panel size are unchanged, e.g.
+    when paging back to a component or closing the help window.
+    """
+
+    def __init__(self, maxsize: int = 64) -> None:
+        self.maxsize = maxsize
+        # Entries hold on to their component, so its id() can't be reused by another
+        self._entries: OrderedDict[
+            int,
+            tuple[
+                SupportedComponent, Size.FixedSize, pydantic.BaseModel, ColoredCharArray
+            ],
+        ] = OrderedDict()
+
+    def get(
+        self, size: Size.FixedSize, component: SupportedComponent
+    ) -> Optional[ColoredCharArray]:
+        entry = self._entries.get(id(component))
+        if entry is None:
+            return None
+        cached_component, cached_size, cached_state, char_array = entry
+        if (
+            cached_component is component
+            and cached_size == size
+            and cached_state == component.state
+        ):
+            self._entries.move_to_end(id(component))
+            return char_array
+        return None
+
+    def put(
+        self,
+        size: Size.FixedSize,
+        component: SupportedComponent,
+        char_array: ColoredCharArray,
+    ) -> None:
+        # View states are mutated in place, so keep a snapshot to compare against
+        self._entries[id(component)] = (
+            component,
+            size,
+            component.state.model_copy(deep=True),
+            char_array,
+        )
+        self._entries.move_to_end(id(component))
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
 class Windows(pydantic.BaseModel):
     main: curses.window
     status: curses.window
     debug: curses.window
     grid: list[curses.window]
+    grid_inner: list[curses.window]  # Inside the border of each grid window
     help: curses.window
     user_input: curses.window
 
@@ -141,13 +208,14 @@ def apply_layout(window: curses.window, state: PanelAppState) -> Windows:
         status=status_window,
         debug=debug_window,
         grid=grid_windows,
+        grid_inner=[draw.inner_window(window) for window in grid_windows],
         help=help_window,
         user_input=user_input_window,
     )
 
 
 def show_help_window(window: curses.window, handler: key_handlers.KeyHandler) -> None:
-    window.clear()
+    window.erase()
     _, inner_window = draw.make_border(window, solid=True)
     help_text_paged = draw.page_and_wrap_text(
         handler.help(),
@@ -188,6 +256,7 @@ async def run(  # noqa: C901
     components: list[SupportedComponent],
     rows: int = 1,
     cols: int = 1,
+    processes: bool = False,
 ) -> None:
     stdscr.nodelay(True)
     curses.use_default_colors()
@@ -200,7 +269,17 @@ async def run(  # noqa: C901
         ),
         components=components,
     )
-    layout = apply_layout(stdscr, state)
+    # Subwindows stay valid until the screen is resized, so layouts are reused when
+    # switching back and forth between grid sizes (e.g. zooming in and out of a panel)
+    layouts: dict[tuple[tuple[int, int], GridState], Windows] = {}
+
+    def get_layout() -> Windows:
+        key = (stdscr.getmaxyx(), state.grid)
+        if key not in layouts:
+            layouts[key] = apply_layout(stdscr, state)
+        return layouts[key]
+
+    layout = get_layout()
     grid: Stack[GridState] = Stack(state.grid)
     handler: Stack[key_handlers.KeyHandler] = Stack(key_handlers.default_handler)
 
@@ -208,64 +287,175 @@ async def run(  # noqa: C901
     renderer = make_intensity_renderer(cmap, shape=CharShape.Half)
     context.set_active(list(cmap.colors))
 
-    keys_queue = asyncio.Queue(maxsize=1)
+    # Reading files and computing views is mostly numpy/PIL/cv2 work that releases the GIL,
+    # so the visible components are rendered concurrently.
+    executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+    # Spectrograms are mostly Python-driven numpy work, so with processes=True they get
+    # a core each. Only audio goes there; its reader holds nothing but file metadata,
+    # while the image and video readers keep decoded pixels that would be copied over
+    # (and then thrown away) on every render.
+    audio_executor: Optional[Executor] = None
+
+    def get_audio_executor() -> Executor:
+        """
+        The executor for audio renders, starting the process pool on first use
+
+        Workers are spawned rather than forked, since forking would copy the curses
+        state and the running executor threads into them.
+        """
+        nonlocal audio_executor
+        if not processes:
+            return executor
+        if audio_executor is None:
+            audio_executor = ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return audio_executor
+
+    render_cache = RenderCache()
+
+    keys_queue: asyncio.Queue[int] = asyncio.Queue()
     events_queue = asyncio.Queue(maxsize=1)
 
+    def read_keys() -> None:
+        """
+        Queue up every key that is ready to be read (stdscr is in nodelay mode)
+        """
+        while (ch := stdscr.getch()) != -1:
+            keys_queue.put_nowait(ch)
+
     async def listen_for_keys() -> None:
         """
-        Should be run in a separate thread.
+        Read keys whenever stdin becomes readable, so the loop is idle between keypresses
         """
-        while True:
-            ch: int = stdscr.getch()
-            assert ch is not None
-            if ch != -1:
-                loop.call_soon_threadsafe(keys_queue.put_nowait, ch)
-            await asyncio.sleep(state.poll_interval)
+        fd = sys.stdin.fileno()
+        try:
+            loop.add_reader(fd, read_keys)
+        except NotImplementedError:
+            # Some event loops (e.g. the Windows proactor loop) can't watch stdin
+            while True:
+                read_keys()
+                await asyncio.sleep(state.poll_interval)
+
+        try:
+            read_keys()
+            await loop.create_future()  # Wait until cancelled
+        finally:
+            loop.remove_reader(fd)
 
     def log(msg: str) -> None:
         _, max_x = layout.debug.getmaxyx()
         msg = msg[: max_x - 2]
-        layout.debug.clear()
+        layout.debug.erase()
         layout.debug.addstr(0, 1, msg)
         layout.debug.refresh()
 
     def status(msg: str) -> None:
         _, max_x = layout.status.getmaxyx()
         msg = msg[: max_x - 2]
-        layout.status.clear()
+        layout.status.erase()
         layout.status.addstr(0, 1, msg)
         layout.status.refresh()
 
     def redraw(window_idxs: Optional[set[int]] = None, clear: bool = True) -> None:
         if clear:
+            # Only blank the windows in memory. window.clear() would force curses to repaint
+            # the entire terminal on the next refresh, and refreshing here would flash the
+            # empty window; refreshing once after drawing sends only what changed
             for i, window in enumerate(layout.grid):
                 if window_idxs is not None and i not in window_idxs:
                     continue
-                window.clear()
-                window.refresh()
+                window.erase()
 
+        components = state.components
+        paginator = state.paginator
+        current_page = state.current_page
+        to_render: list[tuple[int, bool, SupportedComponent]] = []
         for i, window in enumerate(layout.grid):
             if window_idxs is not None and i not in window_idxs:
                 continue
 
-            position = state.paginator.locate_rel(state.current_page, i)
-
-            if position.abs_idx >= len(state.components):
-                window.refresh()
+            abs_idx = paginator.locate_rel(current_page, i).abs_idx
+            if abs_idx >= len(components):
+                window.noutrefresh()
                 continue
 
-            if not len(state.components):
-                window.refresh()
-                continue
-
-            component = state.components[position.abs_idx]
-            _, inner_window = set_border(
-                i, position.abs_idx == state.active_component_idx
+            to_render.append(
+                (i, abs_idx == state.active_component_idx, components[abs_idx])
             )
-            render_component(inner_window, component, renderer)
-            window.refresh()
+
+        # Start reading and rendering before drawing any borders, so the file I/O in the
+        # workers overlaps with the (possibly also file-reading) border labels drawn here
+        grid_inner = layout.grid_inner
+        sizes = [draw.size_from_window(grid_inner[i]) for i, _, _ in to_render]
+        char_arrays = [
+            render_cache.get(size, component)
+            for size, (_, _, component) in zip(sizes, to_render)
+        ]
+        futures = {
+            i: (
+                get_audio_executor()
+                if isinstance(to_render[i][2], AudioComponentView)
+                else executor
+            ).submit(render_component, sizes[i], to_render[i][2], renderer)
+            for i, char_array in enumerate(char_arrays)
+            if char_array is None
+        }
+        # Panels are staged with noutrefresh and sent to the terminal together. The screen
+        # is only updated early before waiting on a render, so panels that are ready show
+        # up while slower ones are still being computed
+        for i, (window_idx, active, component) in enumerate(to_render):
+            window, inner_window = set_border(window_idx, active)
+            char_array = char_arrays[i]
+            if char_array is None:
+                if not futures[i].done():
+                    curses.doupdate()
+                char_array = futures[i].result()
+                render_cache.put(sizes[i], component, char_array)
+            context.display(inner_window, char_array)
+            window.noutrefresh()
+        curses.doupdate()
         curses.curs_set(0)
 
+    pending_redraw: Optional[tuple[Optional[set[int]], bool]] = None
+
+    def request_redraw(
+        window_idxs: Optional[set[int]] = None, clear: bool = True
+    ) -> None:
+        """
+        Schedule a redraw(), merged with any other redraw that hasn't been drawn yet
+        """
+        nonlocal pending_redraw
+        if pending_redraw is not None:
+            pending_idxs, pending_clear = pending_redraw
+            if pending_idxs is None or window_idxs is None:
+                window_idxs = None
+            else:
+                window_idxs = pending_idxs | window_idxs
+            clear = clear or pending_clear
+        pending_redraw = (window_idxs, clear)
+
+    # Panels whose border has to be redrawn because the selection moved on or off them
+    pending_borders: set[int] = set()
+
+    def flush_redraw() -> None:
+        nonlocal pending_redraw
+        if pending_redraw is not None:
+            window_idxs, clear = pending_redraw
+            pending_redraw = None
+            redraw(window_idxs, clear=clear)
+        if pending_borders:
+            paginator = state.paginator
+            active_idx = paginator.locate_abs(state.active_component_idx).rel_idx
+            for i in sorted(pending_borders):
+                if paginator.locate_rel(state.current_page, i).abs_idx < len(
+                    state.components
+                ):
+                    set_border(i, solid=i == active_idx)
+            pending_borders.clear()
+            curses.doupdate()
+
     def set_border(window_idx: int, solid: bool) -> tuple[curses.window, curses.window]:
         if not len(state.components):
             return layout.grid[window_idx], layout.grid[window_idx]
@@ -273,25 +463,22 @@ async def run(  # noqa: C901
         component = state.components[
             state.paginator.locate_rel(state.current_page, window_idx).abs_idx
         ]
-        outer_window, inner_window = draw.make_border(
-            layout.grid[window_idx], solid=solid
-        )
-        layout.grid[window_idx].addstr(0, 1, component.file_.filename)
+        window = layout.grid[window_idx]
+        draw.draw_border(window, solid=solid)
+        window.addstr(0, 1, component.file_.filename)
 
+        label = None
         if isinstance(component, AudioComponentView):
             time_range = component.file_.effective_time_range(component.state)
-            time_range_str = f"{time_range.start:.2f}s-{time_range.end:.2f}s"
-            start_col = layout.grid[window_idx].getmaxyx()[1] - len(time_range_str) - 1
-            last_row = layout.grid[window_idx].getmaxyx()[0] - 1
-            layout.grid[window_idx].addstr(last_row, start_col, time_range_str)
+            label = f"{time_range.start:.2f}s-{time_range.end:.2f}s"
         elif isinstance(component, VideoComponentView):
-            frame_str = f"{component.state.frame}/{component.file_.ensure_metadata().frame_count}"
-            start_col = layout.grid[window_idx].getmaxyx()[1] - len(frame_str) - 1
-            last_row = layout.grid[window_idx].getmaxyx()[0] - 1
-            layout.grid[window_idx].addstr(last_row, start_col, frame_str)
+            label = f"{component.state.frame}/{component.file_.ensure_metadata().frame_count}"
+        if label is not None:
+            max_y, max_x = window.getmaxyx()
+            window.addstr(max_y - 1, max_x - len(label) - 1, label)
 
-        layout.grid[window_idx].refresh()
-        return outer_window, inner_window
+        window.noutrefresh()
+        return window, layout.grid_inner[window_idx]
 
     def update_grid(grid: GridState) -> None:
         state.grid = grid
@@ -302,27 +489,31 @@ async def run(  # noqa: C901
         if new_position.page != state.current_page:
             state.current_page = new_position.page
             state.active_component_idx = idx
-            redraw()
+            request_redraw()
             return
 
+        # Only the panels the selection starts and ends on need new borders, however
+        # many moves a held down arrow key queues up in between
         old_position = state.paginator.locate_abs(state.active_component_idx)
-        set_border(old_position.rel_idx, solid=False)
-        set_border(new_position.rel_idx, solid=True)
+        pending_borders.update((old_position.rel_idx, new_position.rel_idx))
         state.active_component_idx = idx
 
-    async def key_handler_task() -> None:
-        while True:
-            ch = await keys_queue.get()
-            events_queue.put_nowait(handler.current().handle(ch))
-
-    handler_task = loop.create_task(key_handler_task())
     key_listener = loop.create_task(listen_for_keys())
 
     try:
         redraw()
         set_selection(state.active_component_idx)
         while True:
-            event = await events_queue.get()
+            # Apply every event that is already queued up (e.g. from a held down key) before
+            # drawing, so a burst of keys costs one redraw rather than one per key
+            if keys_queue.empty() and events_queue.empty():
+                flush_redraw()
+            # Keys are only turned into events once the previous event has been applied,
+            # since it may have changed the handler (e.g. opening the help or an input box)
+            if not events_queue.empty():
+                event = events_queue.get_nowait()
+            else:
+                event = handler.current().handle(await keys_queue.get())
             if isinstance(event, events.QuitEvent):
                 break
             elif isinstance(event, events.NextPage):
@@ -336,7 +527,7 @@ async def run(  # noqa: C901
                     state.active_component_idx = state.paginator.locate_rel(
                         state.current_page, 0
                     ).abs_idx
-                redraw()
+                request_redraw()
             elif isinstance(event, events.PrevPage):
                 state.current_page = (state.current_page - 1) % state.paginator.n_pages(
                     len(state.components)
@@ -348,13 +539,14 @@ async def run(  # noqa: C901
                     state.active_component_idx = state.paginator.locate_rel(
                         state.current_page, 0
                     ).abs_idx
-                redraw()
+                request_redraw()
             elif isinstance(event, events.LogEvent):
                 log(event.msg)
             elif isinstance(event, events.WindowResized):
                 curses.resizeterm(*stdscr.getmaxyx())
-                layout = apply_layout(stdscr, state)
-                redraw()
+                layouts.clear()
+                layout = get_layout()
+                request_redraw()
             elif isinstance(event, events.Move.Right):
                 set_selection(
                     min(state.active_component_idx + 1, len(state.components) - 1)
@@ -376,16 +568,17 @@ async def run(  # noqa: C901
                     continue
                 grid.push(GridState(rows=1, cols=1))
                 update_grid(grid=grid.current())
-                layout = apply_layout(stdscr, state)
-                redraw()
+                layout = get_layout()
+                request_redraw()
                 handler.push(key_handlers.zoom_handler)
             elif isinstance(event, events.ShowHelp):
                 if isinstance(handler.current(), key_handlers.HelpHandler):
                     continue
+                flush_redraw()  # The help window is drawn on top of the grid
                 show_help_window(layout.help, handler.current())
                 handler.push(key_handlers.make_help_handler(handler.current()))
             elif isinstance(event, events.CloseHelp):
-                redraw()
+                request_redraw()
                 handler.pop()
                 if event.passthru_event is not None:
                     await events_queue.put(event.passthru_event)
@@ -393,23 +586,34 @@ async def run(  # noqa: C901
                 if grid.size() > 1:
                     grid.pop()
                     update_grid(grid=grid.current())
-                    layout = apply_layout(stdscr, state)
-                    layout.main.clear()
-                    redraw()
+                    layout = get_layout()
+                    layout.main.erase()
+                    request_redraw()
                 handler.pop()
             elif isinstance(event, events.RequestInput):
-                layout.user_input.clear()
+                flush_redraw()  # The input box is drawn on top of the grid
+                layout.user_input.erase()
+                # The input box reads from curses directly, so hand it back any keys that
+                # were typed ahead of it (ungetch is last in, first out)
+                typed_ahead = []
+                while not keys_queue.empty():
+                    typed_ahead.append(keys_queue.get_nowait())
+                for ch in reversed(typed_ahead):
+                    curses.ungetch(ch)
                 result = draw.request_input(
                     layout.user_input, str(event.kind.__name__), event.kind.from_str
                 )
+                # Keys typed during the input were read by curses but never reached stdin's
+                # readiness callback, so drain them now
+                read_keys()
                 if result is None:
-                    redraw()
+                    request_redraw()
                 elif isinstance(result, draw.InputResult):
                     await events_queue.put(result.value)
                 elif isinstance(result, draw.InputError):
                     status(result.msg)
-                    layout.user_input.clear()
-                    redraw()
+                    layout.user_input.erase()
+                    request_redraw()
                 else:
                     raise ValueError(f"Unknown input result {result}")
             elif isinstance(event, events.SetCols):
@@ -418,29 +622,29 @@ async def run(  # noqa: C901
                     event.value = 8
                 update_grid(grid=GridState(rows=state.grid.rows, cols=event.value))
                 grid.push(state.grid)
-                layout = apply_layout(stdscr, state)
-                layout.main.clear()
-                redraw()
+                layout = get_layout()
+                layout.main.erase()
+                request_redraw()
             elif isinstance(event, events.SetRows):
                 if event.value > 8:
                     status("Max 8 rows")
                     event.value = 8
                 update_grid(grid=GridState(rows=event.value, cols=state.grid.cols))
                 grid.push(state.grid)
-                layout = apply_layout(stdscr, state)
-                layout.main.clear()
-                redraw()
+                layout = get_layout()
+                layout.main.erase()
+                request_redraw()
             elif isinstance(event, events.SetTimeRange):
                 for component in state.components:
                     if isinstance(component, AudioComponentView):
                         component.state.time_range = event.value
-                redraw()
+                request_redraw()
             elif isinstance(event, events.JumpToFrame):
                 component = state.components[state.active_component_idx]
                 if isinstance(component, VideoComponentView):
                     max_frame = component.file_.ensure_metadata().frame_count - 1
                     component.state.frame = max(0, min(event.value, max_frame))
-                    redraw(
+                    request_redraw(
                         window_idxs={
                             state.paginator.locate_abs(
                                 state.active_component_idx
@@ -453,7 +657,7 @@ async def run(  # noqa: C901
                 if isinstance(component, VideoComponentView):
                     max_frame = component.file_.ensure_metadata().frame_count - 1
                     component.state.frame = max(0, component.state.frame - 1)
-                    redraw(
+                    request_redraw(
                         window_idxs={
                             state.paginator.locate_abs(
                                 state.active_component_idx
@@ -467,7 +671,7 @@ async def run(  # noqa: C901
                 if isinstance(component, VideoComponentView):
                     max_frame = component.file_.ensure_metadata().frame_count - 1
                     component.state.frame = min(component.state.frame + 1, max_frame)
-                    redraw(
+                    request_redraw(
                         window_idxs={
                             state.paginator.locate_abs(
                                 state.active_component_idx
@@ -480,8 +684,11 @@ async def run(  # noqa: C901
     except KeyboardInterrupt:
         pass
     finally:
-        handler_task.cancel()
         key_listener.cancel()
+        executor.shutdown(wait=False, cancel_futures=True)
+        if audio_executor is not None:
+            # Wait for the workers to exit so they aren't torn down during interpreter exit
+            audio_executor.shutdown(wait=True, cancel_futures=True)
 
 
 def expand_folders(files: list[str], recursive: bool = False) -> list[str]:
@@ -521,12 +728,22 @@ def resolve_component(filename: str) -> Optional[SupportedComponent]:
         return None
 
 
-def main(files: list[str], rows: int = 1, cols: int = 1) -> None:
+def main(
+    files: list[str], rows: int = 1, cols: int = 1, processes: bool = False
+) -> None:
     files = expand_folders(files)
     components = [component for f in files if (component := resolve_component(f))]
 
     def run_fn(stdscr: curses.window) -> None:
-        asyncio.run(run(stdscr, rows=rows, cols=cols, components=components))
+        asyncio.run(
+            run(
+                stdscr,
+                rows=rows,
+                cols=cols,
+                components=components,
+                processes=processes,
+            )
+        )
 
     context.run_with_stdscr(run_fn)
 
@@ -538,10 +755,13 @@ if __name__ == "__main__":
     @click.argument("files", nargs=-1)
     @click.option("--rows", default=1, help="Number of rows in grid")
     @click.option("--cols", default=1, help="Number of cols in grid")
-    def cli(files: list[str], rows: int, cols: int) -> None:
+    @click.option(
+        "--processes", is_flag=True, help="Compute spectrograms in separate processes"
+    )
+    def cli(files: list[str], rows: int, cols: int, processes: bool) -> None:
         if not len(files):
             click.echo("Must specify at least one file")
             return
-        main(files, rows=rows, cols=cols)
+        main(files, rows=rows, cols=cols, processes=processes)
 
     cli()
@@ -53,15 +53,10 @@ def layout_grid(
     ]
 
 
-def make_border(
-    window: curses.window, solid: bool = False
-) -> tuple[curses.window, curses.window]:
+def draw_border(window: curses.window, solid: bool = False) -> None:
     """
     Draws unicode border on window
-
-    Returns outer and inner windows.
     """
-    outer_size = window.getmaxyx()
     if solid:
         window.border(
             0,
@@ -74,18 +69,17 @@ def make_border(
             curses.ACS_LRCORNER,
         )
     else:
-        window.border(
-            1,
-            1,
-            1,
-            1,
-            1,
-            1,
-            1,
-            1,
-        )
+        # Blank out the border. Anything non-printing would leave whatever was on the
+        # terminal there, and throw off curses' idea of where the cursor is.
+        window.border(*[" "] * 8)
+
 
-    return window, window.derwin(
+def inner_window(window: curses.window) -> curses.window:
+    """
+    Get the subwindow of a window that lies inside its border
+    """
+    outer_size = window.getmaxyx()
+    return window.derwin(
         outer_size[0] - 2,
         outer_size[1] - 2,
         1,
@@ -93,6 +87,18 @@ def make_border(
     )
 
 
+def make_border(
+    window: curses.window, solid: bool = False
+) -> tuple[curses.window, curses.window]:
+    """
+    Draws unicode border on window
+
+    Returns outer and inner windows.
+    """
+    draw_border(window, solid=solid)
+    return window, inner_window(window)
+
+
 class Span:
     @dataclass
     class Fixed:
@@ -2,18 +2,18 @@
 Stateless pagination utility functions
 """
 import math
-from typing import Any
+from dataclasses import dataclass
 
-import pydantic
 
-
-class Position(pydantic.BaseModel):
+@dataclass(frozen=True, slots=True)
+class Position:
     page: int
     abs_idx: int
     rel_idx: int
 
 
-class GridPaginator(pydantic.BaseModel):
+@dataclass(frozen=True, slots=True)
+class GridPaginator:
     """
     Represent page numbers, absolute position, and relative position in a paginated grid
 
@@ -50,7 +50,7 @@ class GridPaginator(pydantic.BaseModel):
     rows: int
     cols: int
 
-    def model_post_init(self, __context: Any) -> None:
+    def __post_init__(self) -> None:
         assert self.rows > 0
         assert self.cols > 0
 
@@ -2,18 +2,10 @@ from __future__ import annotations
 
 import asyncio
 import dataclasses
-from typing import AsyncIterator, Optional, TypeVar
+import functools
+from typing import AsyncIterator, NamedTuple, Optional, TypeVar, Union, overload
 
 import numpy as np
-
-try:
-    import sounddevice as sd
-except OSError as e:
-    import warnings
-
-    warnings.warn("sounddevice could not be imported: %s" % e)
-    sd = None
-
 from numpy.typing import NDArray
 
 
@@ -29,10 +21,28 @@ class AudioChunk:
     sample_rate: int
 
 
+@functools.lru_cache(maxsize=None)
+def _get_sounddevice():
+    """
+    Import sounddevice on first use, since loading PortAudio is only needed for live audio
+
+    Returns None if PortAudio is not available.
+    """
+    try:
+        import sounddevice
+    except OSError as e:
+        import warnings
+
+        warnings.warn("sounddevice could not be imported: %s" % e)
+        return None
+    return sounddevice
+
+
 def list_devices():
     """
     List the available audio devices
     """
+    sd = _get_sounddevice()
     if sd is None:
         raise OSError(
             "sounddevice could not be imported. You may need to install libportaudio2"
@@ -40,18 +50,32 @@ def list_devices():
     return sd.query_devices()
 
 
+# How many chunks stream_audio holds for a slow consumer before dropping the oldest.
+# Enough to ride out a slow redraw without letting a backlog build up
+_MAX_QUEUED_CHUNKS = 8
+
+
 async def stream_audio(device_idx: Optional[int] = None) -> AsyncIterator[AudioChunk]:
     """
     Stream audio from audio device (defualt None)
+
+    If the consumer falls behind, the oldest chunks are dropped so what it sees stays
+    close to real time.
     """
+    sd = _get_sounddevice()
     if sd is None:
         raise OSError(
             "sounddevice could not be imported. You may need to install libportaudio2"
         )
 
-    q: asyncio.Queue[AudioChunk] = asyncio.Queue()
+    q: asyncio.Queue[AudioChunk] = asyncio.Queue(maxsize=_MAX_QUEUED_CHUNKS)
     loop = asyncio.get_running_loop()
 
+    def put_latest(chunk: AudioChunk):
+        if q.full():
+            q.get_nowait()
+        q.put_nowait(chunk)
+
     def cb(
         indata: NDArray[np.int16],
         frames: int,
@@ -59,7 +83,7 @@ async def stream_audio(device_idx: Optional[int] = None) -> AsyncIterator[AudioC
         __status,
     ):
         loop.call_soon_threadsafe(
-            q.put_nowait,
+            put_latest,
             AudioChunk(
                 data=indata.copy(),
                 frames=frames,
@@ -92,46 +116,113 @@ async def test_listen():
 T = TypeVar("T", NDArray, float)
 
 
-def db_scale(x: T, dB: float) -> T:
+@overload
+def db_scale(x: T, dB: float, out: None = None) -> T:
+    ...
+
+
+@overload
+def db_scale(x: NDArray, dB: float, out: NDArray) -> NDArray:
+    ...
+
+
+def db_scale(
+    x: Union[NDArray, float], dB: float, out: Optional[NDArray] = None
+) -> Union[NDArray, float]:
     """
     Scale the channels of a signal (in dB) independently
+
+    If out is given (it can be x itself), the result is written there instead of a new array
     """
-    return np.power(10.0, dB / 20.0) * x
+    gain = np.power(10.0, dB / 20.0)
+    if out is None:
+        return gain * x
+    np.multiply(x, gain, out=out)
+    return out
 
 
 def _get_frequencies(signal_length: int, sample_rate: int):
     freq = np.fft.fftfreq(signal_length, d=1.0 / sample_rate)
-    nz = freq >= 0.0
-    return freq[nz]
+    # The non-negative frequencies always come first
+    return freq[: (signal_length + 1) // 2]
 
 
-def _calculate_fft(
-    signal: NDArray[np.float64],
-    sample_rate: int,
-    nstd: float,
-) -> tuple[NDArray[np.float64], NDArray[np.complex128]]:
-    assert signal.ndim == 1
+@functools.lru_cache(maxsize=None)
+def _get_rfft():
+    """
+    Use scipy's fft (which can split a batch across threads) when it is installed
 
-    win_size = len(signal)
-    if win_size % 2 == 0:
-        win_size += 1
+    Imported lazily so the import cost is only paid once a spectrogram is computed.
+    """
+    try:
+        import scipy.fft  # type: ignore[import]  # Optional, see the "fast" extra
+    except ImportError:
+        return np.fft.rfft
+    return functools.partial(scipy.fft.rfft, workers=-1)
+
+
+# Number of windows transformed by a single batched fft call. Bounds the size of the
+# temporary frame matrix for long signals.
+_STFT_BLOCK_SIZE = 1024
+
+
+class _STFTPlan(NamedTuple):
+    """
+    Arrays that only depend on the spectrogram parameters, reused across frames and calls
+    """
+
+    gauss_window: NDArray[np.float32]
+    freq_arr: NDArray[np.floating]
+    freq_index: slice  # Range of the (one-sided) rfft output to keep
+
+
+@functools.lru_cache(maxsize=32)
+def _get_stft_plan(
+    win_size: int,
+    sampling_rate: int,
+    nstd: float,
+    min_freq: float,
+    max_freq: float,
+) -> _STFTPlan:
     half_win_size = win_size // 2
 
     # Construct the window
     gauss_t = np.arange(-half_win_size, half_win_size + 1, 1.0)
     gauss_std = float(win_size) / float(nstd)
-    gauss_window = np.exp(-(gauss_t**2) / (2.0 * gauss_std**2)) / (
-        gauss_std * np.sqrt(2 * np.pi)
+    gauss_window = (
+        np.exp(-(gauss_t**2) / (2.0 * gauss_std**2))
+        / (gauss_std * np.sqrt(2 * np.pi))
+    ).astype(np.float32)
+
+    # win_size is always odd, so these are exactly the non-negative fftfreq frequencies
+    rfft_freq = np.fft.rfftfreq(win_size, d=1.0 / sampling_rate)
+    # The frequencies are sorted, so the ones in [min_freq, max_freq] are a contiguous
+    # range that can be sliced out without copying
+    freq_index = slice(
+        int(np.searchsorted(rfft_freq, min_freq, side="left")),
+        int(np.searchsorted(rfft_freq, max_freq, side="right")),
+    )
+    freq_arr = rfft_freq[freq_index]
+
+    # The plan is shared between calls, so don't let anyone modify it
+    for arr in (gauss_window, freq_arr):
+        arr.setflags(write=False)
+
+    return _STFTPlan(
+        gauss_window=gauss_window, freq_arr=freq_arr, freq_index=freq_index
     )
 
-    # Window the signal and take the FFT
-    fft_len = len(signal)
-    windowed_slice = signal[:fft_len] * gauss_window[:fft_len]
-    s_fft = np.fft.fft(windowed_slice, n=fft_len)
-    freq = np.fft.fftfreq(fft_len, d=1.0 / sample_rate)
-    nz = freq >= 0.0
 
-    return freq[nz], s_fft[nz]
+def _zero_padded(signal: NDArray, start: int, stop: int) -> NDArray:
+    """
+    signal[start:stop], treating samples before the start or past the end as zeros
+    """
+    padded = np.zeros([stop - start], dtype=signal.dtype)
+    lo = max(start, 0)
+    hi = min(stop, len(signal))
+    if hi > lo:
+        padded[lo - start : hi - start] = signal[lo:hi]
+    return padded
 
 
 def _get_window_length(freq_spacing: float, nstd: float) -> float:
@@ -139,12 +230,13 @@ def _get_window_length(freq_spacing: float, nstd: float) -> float:
 
 
 TimeArray = NDArray[np.float64]
-FrequencyArray = NDArray[np.float64]
-SpectrogramArray = NDArray[np.float64]  # Expect a 2D array
+FrequencyArray = NDArray[np.floating]
+# Everything downstream is quantized to a handful of colors, so float32 is plenty
+SpectrogramArray = NDArray[np.float32]  # Expect a 2D array
 
 
 def compute_spectrogram(
-    signal: NDArray[np.float64],
+    signal: NDArray[np.floating],
     sampling_rate: int,
     spec_sample_rate: int,
     freq_spacing: float,
@@ -158,6 +250,7 @@ def compute_spectrogram(
     dependency and avoid slow import
     """
     assert signal.ndim == 1
+    signal = np.asarray(signal, dtype=np.float32)
 
     increment = 1.0 / spec_sample_rate
     window_length = _get_window_length(freq_spacing, nstd)
@@ -179,42 +272,62 @@ def compute_spectrogram(
 
     # assert len(signal) > win_size, "len(s)=%d, win_size=%d" % (len(signal), win_size)
 
-    # Get the values for the frequency axis by estimating the spectrum of a dummy slice
-    full_freq = _get_frequencies(win_size, sampling_rate)
-    freq_index = (full_freq >= min_freq) & (full_freq <= max_freq)
-    freq_arr = full_freq[freq_index]
-    nfreq = freq_index.sum()
+    # The window and frequency axis only depend on the parameters, so they are cached
+    plan = _get_stft_plan(win_size, sampling_rate, nstd, min_freq, max_freq)
+    nfreq = len(plan.freq_arr)
 
-    nincrement = int(np.round(sampling_rate * increment))
+    if sampling_rate % spec_sample_rate == 0:
+        # Exact when the rates divide evenly, which they usually do
+        nincrement = int(sampling_rate // spec_sample_rate)
+    else:
+        nincrement = int(np.round(sampling_rate * increment))
     nwindows = len(signal) // nincrement
-    # Pad the signal with zeros
-    zeros = np.zeros([len(signal) + 2 * half_win_size])
-    zeros[half_win_size:-half_win_size] = signal
-    window_centers = np.arange(nwindows) * nincrement + half_win_size
-
-    # Take the FFT of each segment, padding with zeros when necessary to keep window length the same
-    spec = np.zeros([nfreq, nwindows], dtype="complex")
-    for k in range(nwindows):
-        center = window_centers[k]
-        start_idx = center - half_win_size
-        end_idx = center + half_win_size + 1
-
-        spec_freq, est = _calculate_fft(
-            zeros[start_idx:end_idx],
-            sampling_rate,
-            nstd,
-        )
-        findex = (spec_freq <= max_freq) & (spec_freq >= min_freq)
-        spec[:, k] = est[findex]
+
+    # Window k is centered on sample k * nincrement. Windows that lie entirely within the
+    # signal are read straight out of it; only the ones overlapping either end are copied
+    # into a buffer padded with zeros to keep the window length the same
+    first_inner = min(-(-half_win_size // nincrement), nwindows)
+    last_inner = min((len(signal) - half_win_size - 1) // nincrement + 1, nwindows)
+    last_inner = max(last_inner, first_inner)
+
+    rfft = _get_rfft()
+    spec = np.empty([nfreq, nwindows], dtype=np.float32)
+    for first, last in (
+        (0, first_inner),
+        (first_inner, last_inner),
+        (last_inner, nwindows),
+    ):
+        if first == last:
+            continue
+        # The samples covered by windows first..last-1
+        start = first * nincrement - half_win_size
+        stop = (last - 1) * nincrement + half_win_size + 1
+        if start >= 0 and stop <= len(signal):
+            samples = signal[start:stop]
+        else:
+            samples = _zero_padded(signal, start, stop)
+        # A view of each window's segment, without copying any samples
+        segments = np.lib.stride_tricks.sliding_window_view(samples, win_size)
+        segments = segments[::nincrement]
+
+        # Take the FFT of a block of segments at a time
+        for block_start in range(0, last - first, _STFT_BLOCK_SIZE):
+            block = segments[block_start : block_start + _STFT_BLOCK_SIZE]
+            est = rfft(block * plan.gauss_window, axis=1)
+            # Only the magnitude is returned, so write it straight into the output
+            # without a temporary magnitude array
+            np.abs(
+                est[:, plan.freq_index].T,
+                out=spec[:, first + block_start : first + block_start + len(block)],
+            )
 
     # Note that the desired spectrogram rate could be slightly modified
     t_arr = np.arange(0, nwindows, 1.0) * float(nincrement) / sampling_rate
-    spec = np.abs(spec)
 
-    return t_arr, freq_arr, spec
+    return t_arr, plan.freq_arr, spec
 
 
-def resize(spec: SpectrogramArray, target_shape: tuple[int, int]) -> SpectrogramArray:
+def resize(spec: NDArray, target_shape: tuple[int, int]) -> NDArray[np.float32]:
     """Resize a 2D array with bilinear interpolation
 
     A modified version of https://chao-ji.github.io/jekyll/update/2018/07/19/BilinearResize.html
@@ -225,7 +338,7 @@ def resize(spec: SpectrogramArray, target_shape: tuple[int, int]) -> Spectrogram
     assert spec.ndim == 2
 
     original_shape = spec.shape
-    resized = np.empty([target_shape[0], target_shape[1]])
+    resized = np.empty([target_shape[0], target_shape[1]], dtype=np.float32)
 
     if target_shape[0] == 1:
         return resize_1d(spec[0], target_shape[1])[None, :]
@@ -236,59 +349,47 @@ def resize(spec: SpectrogramArray, target_shape: tuple[int, int]) -> Spectrogram
     dy = (original_shape[0] - 1) / (target_shape[0] - 1)
     dx = (original_shape[1] - 1) / (target_shape[1] - 1)
 
-    for i in range(target_shape[0]):
-        for j in range(target_shape[1]):
-            # Where would this point have been in the old coordinates?
-            reference_i = i * dy
-            reference_j = j * dx
-
-            ref_i_lower = int(np.floor(reference_i))
-            ref_i_upper = int(np.ceil(reference_i))
-            ref_j_lower = int(np.floor(reference_j))
-            ref_j_upper = int(np.ceil(reference_j))
-
-            # Floating point error can lead to the reference_indices
-            # being ever-so-slightly greater than original_height|width
-            # When that happens, lets just round it down. It will
-            # receive a negligible weight anyway
-            if ref_j_upper == original_shape[1]:
-                ref_j_upper -= 1
-            elif ref_i_upper == original_shape[0]:
-                ref_i_upper -= 1
-
-            corner_00 = spec[ref_i_lower, ref_j_lower]
-            corner_01 = spec[ref_i_lower, ref_j_upper]
-            corner_10 = spec[ref_i_upper, ref_j_lower]
-            corner_11 = spec[ref_i_upper, ref_j_upper]
-
-            # Linear interpolation by distances to corners
-            weight_i_lower = 1 - np.abs(reference_i - ref_i_lower)
-            weight_i_upper = 1 - weight_i_lower
-            weight_j_lower = 1 - np.abs(reference_j - ref_j_lower)
-            weight_j_upper = 1 - weight_j_lower
-
-            corner_00_weight = weight_i_lower * weight_j_lower
-            corner_01_weight = weight_i_lower * weight_j_upper
-            corner_10_weight = weight_i_upper * weight_j_lower
-            corner_11_weight = weight_i_upper * weight_j_upper
-
-            resized[i][j] = (
-                corner_00 * corner_00_weight
-                + corner_01 * corner_01_weight
-                + corner_10 * corner_10_weight
-                + corner_11 * corner_11_weight
-            )
+    # Where would each output row/column have been in the old coordinates?
+    reference_i = np.arange(target_shape[0]) * dy
+    reference_j = np.arange(target_shape[1]) * dx
+
+    # Floating point error can lead to the reference indices being ever-so-slightly
+    # greater than original_height|width - 1. When that happens, just clip the upper
+    # index. It will receive a negligible weight anyway
+    ref_i_lower = np.floor(reference_i).astype(np.intp)
+    ref_i_upper = np.minimum(ref_i_lower + 1, original_shape[0] - 1)
+    ref_j_lower = np.floor(reference_j).astype(np.intp)
+    ref_j_upper = np.minimum(ref_j_lower + 1, original_shape[1] - 1)
+
+    # Linear interpolation by distances to corners
+    weight_i_lower = 1 - (reference_i - ref_i_lower)
+    weight_j_lower = 1 - (reference_j - ref_j_lower)
+    weights_i = np.stack([weight_i_lower, 1 - weight_i_lower])
+    weights_j = np.stack([weight_j_lower, 1 - weight_j_lower])
+
+    # Gather the four corners of every output pixel into one (2, 2, height, width) array
+    # and combine them in a single pass
+    corners = np.empty((2, 2, target_shape[0], target_shape[1]), dtype=spec.dtype)
+    for i, rows in enumerate((spec[ref_i_lower], spec[ref_i_upper])):
+        np.take(rows, ref_j_lower, axis=1, out=corners[i, 0])
+        np.take(rows, ref_j_upper, axis=1, out=corners[i, 1])
+    resized[:] = np.einsum("ih,jw,ijhw->hw", weights_i, weights_j, corners)
 
     return resized
 
 
-def resize_1d(signal: NDArray, output_len: int) -> NDArray:
+def resize_1d(signal: NDArray, output_len: int) -> NDArray[np.float32]:
     assert signal.ndim == 1
-    t = np.linspace(0, len(signal), output_len)
-    resized = np.interp(t, np.linspace(0, len(signal), len(signal)), signal)
-    return resized
+    # The input samples are evenly spaced, so linear interpolation is just a blend of the
+    # two neighboring samples (no need for np.interp to search for them)
+    position = np.linspace(0, len(signal) - 1, output_len)
+    lower = position.astype(np.intp)
+    upper = np.minimum(lower + 1, len(signal) - 1)
+    weight = position - lower
+    resized = signal[lower] * (1 - weight) + signal[upper] * weight
+    return resized.astype(np.float32)
 
 
-def compute_ampenv(signal: NDArray) -> NDArray:
+def compute_ampenv(signal: NDArray, out: Optional[NDArray] = None) -> NDArray:
     assert signal.ndim == 1
-    return np.abs(signal)
+    return np.abs(signal, out=out)
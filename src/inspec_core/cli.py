@@ -2,15 +2,34 @@ from __future__ import annotations
 
 import asyncio
 import os
-from typing import Optional
+from typing import TYPE_CHECKING, Literal, Optional
 
 import click
-from typing_extensions import Literal
-
-from inspec_core.render.types import CharShape
 
 from . import options
 
+if TYPE_CHECKING:
+    from inspec_core.render.types import CharShape
+
+# Importing the render package pulls in numpy and the colormaps, so the --chars choices
+# are plain strings and only converted to a CharShape once a command actually runs
+_CHAR_SHAPES = ["full", "half", "quarter"]
+
+
+def _char_shape(name: str) -> CharShape:
+    from inspec_core.render.types import CharShape
+
+    return CharShape(name)
+
+
+def _image_char_shape(name: str) -> Literal[CharShape.Full, CharShape.Half]:
+    """Images only take full or half characters, as limited by the --chars choices"""
+    from inspec_core.render.types import CharShape
+
+    shape = _char_shape(name)
+    assert shape is CharShape.Full or shape is CharShape.Half
+    return shape
+
 
 @click.group()
 def cli():
@@ -18,25 +37,32 @@ def cli():
 
 
 @cli.command()
-@click.argument("filename")
+@click.argument("filenames", nargs=-1, required=True)
 @click.option("--height", type=int, help="Height of the output image in characters")
 @click.option("--width", type=int, help="Width of the output image in characters")
 @click.option(
     "--chars",
-    type=click.Choice([CharShape.Full, CharShape.Half]),
-    default=CharShape.Full,
+    type=click.Choice(_CHAR_SHAPES[:2], case_sensitive=False),
+    default="full",
     help="Shape of the output characters",
 )
 def imshow(
-    filename: str,
+    filenames: tuple[str, ...],
     height: Optional[int],
     width: Optional[int],
-    chars: Literal[CharShape.Full, CharShape.Half],
+    chars: str,
 ):
-    """Print an image to stdout"""
+    """Print one or more images to stdout"""
     import inspec
 
-    inspec.imshow(filename, height=height, width=width, chars=chars)
+    if len(filenames) == 1:
+        inspec.imshow(
+            filenames[0], height=height, width=width, chars=_image_char_shape(chars)
+        )
+    else:
+        inspec.imshow_many(
+            list(filenames), height=height, width=width, chars=_image_char_shape(chars)
+        )
 
 
 @cli.command()
@@ -45,8 +71,8 @@ def imshow(
 @click.option("--width", type=int, help="Width of the output image in characters")
 @click.option(
     "--chars",
-    type=click.Choice([CharShape.Full, CharShape.Half, CharShape.Quarter]),
-    default=CharShape.Full,
+    type=click.Choice(_CHAR_SHAPES, case_sensitive=False),
+    default="full",
     help="Shape of the output characters",
 )
 @click.option("--cmap", type=str, default="greys", help="Name of the colormap to use")
@@ -54,19 +80,21 @@ def show(
     filename: str,
     height: int,
     width: int,
-    chars: CharShape,
+    chars: str,
     cmap: str,
 ):
     """Print an audio file to stdout"""
     import inspec
+    from inspec_core.render.types import CharShape
 
+    shape = CharShape(chars)
     width = width or os.get_terminal_size().columns // 2
     height = height or os.get_terminal_size().lines // 2
-    if chars == CharShape.Quarter:
+    if shape == CharShape.Quarter:
         width *= 2
-    if chars != CharShape.Full:
+    if shape != CharShape.Full:
         height *= 2
-    inspec.ashow(filename, height=height, width=width, chars=chars, cmap=cmap)
+    inspec.ashow(filename, height=height, width=width, chars=shape, cmap=cmap)
 
 
 @cli.command()
@@ -82,8 +110,8 @@ def show(
 @click.option("--cmap", type=str, default="viridis", help="Name of the colormap to use")
 @click.option(
     "--chars",
-    type=click.Choice([CharShape.Full, CharShape.Half, CharShape.Quarter]),
-    default=CharShape.Full,
+    type=click.Choice(_CHAR_SHAPES, case_sensitive=False),
+    default="full",
     help="Shape of the output characters",
 )
 def listen(
@@ -92,7 +120,7 @@ def listen(
     mode: options.LivePrintMode,
     gain: float,
     cmap: str,
-    chars: CharShape,
+    chars: str,
 ):
     """Listen to audio and print to stdout"""
     import inspec
@@ -105,7 +133,7 @@ def listen(
             mode=mode,
             gain=gain,
             cmap=cmap,
-            chars=chars,
+            chars=_char_shape(chars),
         )
     )
 
@@ -114,10 +142,14 @@ def listen(
 @click.argument("files", nargs=-1)
 @click.option("--rows", type=int, default=1, help="Grid rows")
 @click.option("--cols", type=int, default=2, help="Grid columns")
+@click.option(
+    "--processes", is_flag=True, help="Compute spectrograms in separate processes"
+)
 def open(
     files: list[str],
     rows: int = 1,
     cols: int = 2,
+    processes: bool = False,
 ):
     """
     Open interactive GUI
@@ -127,7 +159,7 @@ def open(
         return
     from inspec_core.app.app import main
 
-    main(files, rows, cols)
+    main(files, rows, cols, processes=processes)
 
 
 if __name__ == "__main__":
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import functools
+import os
 from typing import Optional
 
 import numpy as np
@@ -39,7 +41,11 @@ class AudioViewState(View):
 
 class AudioReader(BaseModel, FileReader[Intensity, AudioViewState]):
     class LoadedData(BaseModel):
-        audio: NDArray[np.float64]
+        """
+        Only the file's metadata; samples are read from disk for the range being viewed
+        """
+
+        frames: int
         sample_rate: int
         channels: list[int]
 
@@ -53,17 +59,18 @@ class AudioReader(BaseModel, FileReader[Intensity, AudioViewState]):
         data = self._ensure_data()
         return EffectiveTimeRange(
             start=0 if view.time_range.start is None else view.time_range.start,
-            end=data.audio.shape[0] / data.sample_rate
+            end=data.frames / data.sample_rate
             if view.time_range.end is None
             else view.time_range.end,
         )
 
     def _ensure_data(self) -> LoadedData:
         if self.data is None:
-            audio, sample_rate = soundfile.read(self.filename, always_2d=True)
-            channels = list(range(audio.shape[1]))
+            info = soundfile.info(self.filename)
             self.data = AudioReader.LoadedData(
-                audio=audio, sample_rate=sample_rate, channels=channels
+                frames=info.frames,
+                sample_rate=info.samplerate,
+                channels=list(range(info.channels)),
             )
         return self.data
 
@@ -75,23 +82,68 @@ class AudioReader(BaseModel, FileReader[Intensity, AudioViewState]):
             else int(view.time_range.start * data.sample_rate)
         )
         end_idx = (
-            data.audio.shape[0]
+            data.frames
             if view.time_range.end is None
             else int(view.time_range.end * data.sample_rate)
         )
-
-        _, _, spec = compute_spectrogram(
-            data.audio[start_idx:end_idx, view.channel],
+        spec = _load_spectrogram(
+            self.filename,
+            os.stat(self.filename).st_mtime_ns,
+            start_idx,
+            end_idx,
+            view.channel,
             data.sample_rate,
-            spec_sample_rate=view.spec_sampling_rate,
-            freq_spacing=view.spec_freq_spacing,
-            min_freq=view.min_freq,
-            max_freq=view.max_freq,
+            view.spec_sampling_rate,
+            view.spec_freq_spacing,
+            view.min_freq,
+            view.max_freq,
         )
-
-        min_val = np.min(spec)
-        max_val = np.max(spec)
-        arr = (spec - min_val) / (max_val - min_val)
-        arr = resize(arr, (size.height, size.width))
-        arr = np.vectorize(Intensity)(arr)
-        return arr
+        # Renderers take the intensities as plain floats, so skip boxing each one
+        return resize(spec, (size.height, size.width))
+
+
+@functools.lru_cache(maxsize=8)
+def _load_spectrogram(
+    filename: str,
+    mtime_ns: int,
+    start_idx: int,
+    end_idx: int,
+    channel: int,
+    sample_rate: int,
+    spec_sample_rate: int,
+    freq_spacing: float,
+    min_freq: float,
+    max_freq: Optional[float],
+) -> NDArray:
+    """
+    Read and normalize the spectrogram of a range of a file
+
+    Cached so that redrawing at a new panel size only has to resize it. The file's mtime
+    is part of the key so edits on disk aren't served stale. The cache is kept small
+    because a full resolution spectrogram of a long file can be hundreds of MB.
+    """
+    audio, _ = soundfile.read(
+        filename,
+        start=start_idx,
+        stop=end_idx,
+        dtype="float32",
+        always_2d=True,
+    )
+    _, _, spec = compute_spectrogram(
+        # Already float32, this only tells the type checker so (without a copy)
+        np.asarray(audio[:, channel], dtype=np.float32),
+        sample_rate,
+        spec_sample_rate=spec_sample_rate,
+        freq_spacing=freq_spacing,
+        min_freq=min_freq,
+        max_freq=max_freq,
+    )
+
+    # The spectrogram is freshly allocated, so normalize it in place
+    min_val = spec.min()
+    max_val = spec.max()
+    spec -= min_val
+    spec /= max_val - min_val
+    # Shared between callers through the cache
+    spec.setflags(write=False)
+    return spec
@@ -58,7 +58,8 @@ class LiveAudioComponent(BaseModel, FileStreamer[Intensity, LiveAudioViewState])
 
     async def _listen(self, view: LiveAudioViewState, size: Size.FixedSize) -> None:
         buffer = np.zeros(
-            (view.listen.chunk_size * view.listen.step_chunks, view.listen.channels)
+            (view.listen.chunk_size * view.listen.step_chunks, view.listen.channels),
+            dtype=np.float32,
         )
         counter = 0
         async for chunk in stream_audio():
@@ -83,8 +84,9 @@ class LiveAudioComponent(BaseModel, FileStreamer[Intensity, LiveAudioViewState])
         assert self._loop is not None
         desired_rows = size.height
         desired_cols = size.width
-        buffer = db_scale(buffer, view.gain)
-        arrays = []
+        # The buffer is a copy made for this update, so it can be scaled in place
+        db_scale(buffer, view.gain, out=buffer)
+        data = np.empty((desired_rows, desired_cols, buffer.shape[1]), dtype=np.float32)
         for channel in range(buffer.shape[1]):
             _, _, spec = compute_spectrogram(
                 buffer[:, channel],
@@ -94,11 +96,10 @@ class LiveAudioComponent(BaseModel, FileStreamer[Intensity, LiveAudioViewState])
                 min_freq=view.min_freq,
                 max_freq=view.max_freq,
             )
-            spec = resize(spec, (desired_rows, desired_cols))
-            arrays.append(spec)
-        data = np.stack(arrays, axis=2)
+            data[:, :, channel] = resize(spec, (desired_rows, desired_cols))
         # scale to 0 to 1
-        data = np.clip(data / view.spec_max, 0, 1)
+        data /= view.spec_max
+        np.clip(data, 0, 1, out=data)
         self._loop.call_soon_threadsafe(
             self._output_queue.put_nowait,
             data,
@@ -113,7 +114,7 @@ class LiveAudioComponent(BaseModel, FileStreamer[Intensity, LiveAudioViewState])
         listen_task = self._loop.create_task(self._listen(view, size))
         try:
             while True:
-                yield np.vectorize(Intensity)(await self._output_queue.get())
+                yield await self._output_queue.get()
         finally:
             listen_task.cancel()
 
@@ -1,6 +1,7 @@
 import os
 from unittest import mock
 
+import numpy as np
 import pytest
 
 from inspec_core.colormaps import get_colormap
@@ -8,7 +9,7 @@ from inspec_core.render import make_intensity_renderer, make_rgb_renderer
 from inspec_core.render.display import display
 from inspec_core.render.types import CharShape
 
-from .audio_view import AudioReader, AudioViewState
+from .audio_view import AudioReader, AudioViewState, _load_spectrogram
 from .image_view import ImageReader, ImageViewState
 from .size import Size
 from .video_view import GreyscaleVideoFrameReader, GreyscaleVideoReader, VideoViewState
@@ -39,6 +40,27 @@ def test_audio_reader(terminal_size):
     display(renderer.apply(arr))
 
 
+def test_audio_reader_reuses_spectrogram():
+    _load_spectrogram.cache_clear()
+    reader = AudioReader(filename="demo/warbling.wav")
+    view = AudioViewState()
+    reader.get_view(view, Size.FixedSize(width=40, height=20))
+    arr = reader.get_view(view, Size.FixedSize(width=80, height=30))
+    assert _load_spectrogram.cache_info().hits == 1
+
+    _load_spectrogram.cache_clear()
+    np.testing.assert_array_equal(
+        arr,
+        AudioReader(filename="demo/warbling.wav").get_view(
+            view, Size.FixedSize(width=80, height=30)
+        ),
+    )
+
+    view.time_range.end = 1.0
+    reader.get_view(view, Size.FixedSize(width=80, height=30))
+    assert _load_spectrogram.cache_info().misses == 2
+
+
 def test_video_reader(terminal_size):
     cmap = get_colormap("greys")
     reader = GreyscaleVideoReader(filename="demo/seagulls.mp4")
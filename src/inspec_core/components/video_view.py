@@ -7,7 +7,6 @@ import numpy as np
 from numpy.typing import NDArray
 from pydantic import BaseModel
 
-from inspec_core.audio_utils import resize
 from inspec_core.render.types import RGB, Intensity
 
 from .base_view import FileReader, FileStreamer, T, View, ViewT
@@ -99,9 +98,8 @@ class GreyscaleVideoFrameReader(BaseVideoReader[Intensity, VideoViewState]):
         )
         frame = self.loaded[1][view.frame]
         frame = cv2.resize(frame, (target_shape.width, target_shape.height))
-        frame = np.clip(frame / 255, 0, 1)
-        frame = np.flipud(frame)
-        return np.vectorize(Intensity)(frame)
+        frame = frame.astype(np.float32) / 255
+        return np.flipud(frame)
 
 
 class RGBVideoFrameReader(BaseVideoReader[RGB, VideoViewState]):
@@ -112,10 +110,6 @@ class RGBVideoFrameReader(BaseVideoReader[RGB, VideoViewState]):
     class Config:
         arbitrary_types_allowed = True
 
-    @staticmethod
-    def _to_rgb(vec: NDArray[np.uint8]) -> RGB:
-        return RGB(*vec)
-
     def get_view(self, view: VideoViewState, size: Size.Size) -> NDArray:
         if self.loaded is None or view.frame not in self.loaded[0]:
             cap = cv2.VideoCapture(self.filename)
@@ -146,8 +140,8 @@ class RGBVideoFrameReader(BaseVideoReader[RGB, VideoViewState]):
         )
         frame = self.loaded[1][view.frame]
         frame = cv2.resize(frame, (target_shape.width, target_shape.height))
-        frame = np.flipud(frame)
-        return np.vectorize(RGBVideoFrameReader._to_rgb, signature="(n) -> ()")(frame)
+        # Renderers take the (height, width, 3) pixels as is, so skip boxing each one
+        return np.flipud(frame)
 
 
 class GreyscaleVideoReader(BaseVideoReader[Intensity, VideoViewState]):
@@ -180,13 +174,11 @@ class GreyscaleVideoReader(BaseVideoReader[Intensity, VideoViewState]):
         target_shape = preserve_aspect_ratio(
             size, original_width=metadata.width, original_height=metadata.height
         )
-        frame = resize(
-            self.loaded[view.frame], (target_shape.height, target_shape.width)
+        frame = cv2.resize(
+            self.loaded[view.frame], (target_shape.width, target_shape.height)
         )
-        frame = np.clip(frame / 255, 0, 1)
-        frame = np.flipud(frame)
-
-        return np.vectorize(Intensity)(frame)
+        frame = frame.astype(np.float32) / 255
+        return np.flipud(frame)
 
 
 class GreyscaleVideoStreamer(BaseModel, FileStreamer[Intensity, View]):
@@ -215,9 +207,8 @@ class GreyscaleVideoStreamer(BaseModel, FileStreamer[Intensity, View]):
             while ret:
                 ret, frame = cap.read()
                 frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-                frame = resize(frame, (target_shape.height, target_shape.width))
-                frame = np.clip(frame / 255, 0, 1)
-                frame = np.flipud(frame)
-                yield np.vectorize(Intensity)(frame)
+                frame = cv2.resize(frame, (target_shape.width, target_shape.height))
+                frame = frame.astype(np.float32) / 255
+                yield np.flipud(frame)
         finally:
             cap.release()
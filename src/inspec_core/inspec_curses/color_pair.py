@@ -3,10 +3,12 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, Iterator
 
+import numpy as np
 import pydantic
+from numpy.typing import NDArray
 
 from inspec_core.render import chars
-from inspec_core.render.types import IChar, XTermColor
+from inspec_core.render.types import ColoredCharArray, IChar, XTermColor
 
 
 @dataclass
@@ -24,6 +26,8 @@ class ColorPairSlot:
 class ColorToSlot(pydantic.BaseModel):
     colors: list[XTermColor]
     _color_idx: dict[XTermColor, int] = pydantic.PrivateAttr()
+    # Index of each xterm color value in self.colors, or -1 if it is not in the set
+    _color_idx_table: NDArray[np.intp] = pydantic.PrivateAttr()
 
     def model_post_init(self, __context: Any) -> None:
         # This was calculated by hand. We have 256 colors but we are also limited to 248 slots of fg/bg
@@ -43,6 +47,9 @@ class ColorToSlot(pydantic.BaseModel):
                 "Cannot initialize a curses colorset with more than 22 colors"
             )
         self._color_idx = {color: i for i, color in enumerate(self.colors)}
+        self._color_idx_table = np.full(256, -1, dtype=np.intp)
+        for color, i in self._color_idx.items():
+            self._color_idx_table[color.value] = i
 
     def _get_slot(self, bin1: int, bin2: int) -> ColorPairSlot:
         assert 0 <= bin2 < bin1 < len(self.colors)
@@ -94,3 +101,33 @@ class ColorToSlot(pydantic.BaseModel):
             fg_idx, bg_idx = bg_idx, fg_idx
 
         return self._get_slot(fg_idx, bg_idx), str(char)
+
+    def convert_array(
+        self, arr: ColoredCharArray
+    ) -> tuple[NDArray[np.intp], NDArray[np.uint8]]:
+        """
+        Apply convert() to every cell of a character array at once
+
+        Returns the color pair slot values and the ids of the characters to draw (indices
+        into render.chars.CHAR_TABLE). Raises KeyError if any color is not in the set.
+        """
+        fg_idx = self._color_idx_table[arr.fg]
+        bg_idx = self._color_idx_table[arr.bg]
+        if np.any(fg_idx < 0) or np.any(bg_idx < 0):
+            raise KeyError("Colors not in the curses colorset")
+
+        char_ids = arr.chars.copy()
+        swap = bg_idx > fg_idx
+        char_ids[swap] = chars.INVERTED_CHAR_IDS[char_ids[swap]]
+        fg_idx, bg_idx = np.maximum(fg_idx, bg_idx), np.minimum(fg_idx, bg_idx)
+
+        # Same color for fg and bg: fill the cell using any slot that includes that color
+        same = fg_idx == bg_idx
+        both_zero = same & (fg_idx == 0)
+        char_ids[same] = chars.char_id(chars.FULL_1)
+        char_ids[both_zero] = chars.char_id(chars.FULL_0)
+        fg_idx = np.where(both_zero, len(self.colors) - 1, fg_idx)
+        bg_idx = np.where(same, 0, bg_idx)
+
+        slots = (fg_idx * (fg_idx - 1)) // 2 + bg_idx + 1
+        return slots, char_ids
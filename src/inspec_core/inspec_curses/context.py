@@ -2,10 +2,16 @@ from __future__ import annotations
 
 import contextvars
 import curses
+import functools
+import itertools
 import logging
+import operator
 import os
 from typing import Optional
 
+import numpy as np
+
+from inspec_core.render.chars import CHAR_TABLE
 from inspec_core.render.colors import XTermColor
 from inspec_core.render.types import ColoredChar, ColoredCharArray
 
@@ -83,6 +89,14 @@ def draw(window: curses.window, row: int, col: int, char: ColoredChar):
     window.addstr(row, col, character, curses.color_pair(slot.value))
 
 
+@functools.lru_cache(maxsize=16)
+def _get_pad(rows: int, cols: int) -> curses.window:
+    """
+    An offscreen pad with a spare column, reused for every display() of the same size
+    """
+    return curses.newpad(rows, cols + 1)
+
+
 def display(window: curses.window, arr: ColoredCharArray):
     """
     Draw a colored character array to a curses window that matches the size of the array
@@ -94,13 +108,29 @@ def display(window: curses.window, arr: ColoredCharArray):
             f"View.render was called with mismatched window size {window.getmaxyx()} != data size: {arr.shape}"
         )
 
-    for row_idx, row in enumerate(arr[::-1]):
-        for col_idx, char in enumerate(row):
-            char: ColoredChar
-            try:
-                draw(window, row_idx, col_idx, char)
-            except curses.error:
-                pass
+    try:
+        slots, char_ids = get_active().convert_array(arr)
+    except KeyError:
+        raise InvalidColor from None
+
+    # Draw offscreen into a pad with a spare column, so writing the bottom-right cell doesn't
+    # raise like it does at the edge of a window, then copy it into the window in one shot.
+    # Every cell is rewritten, so the pad can be reused without clearing it.
+    rows, cols = arr.shape
+    pad = _get_pad(rows, cols)
+    attrs = {slot: curses.color_pair(slot) for slot in np.unique(slots).tolist()}
+    for row_idx, (row_slots, row_chars) in enumerate(
+        zip(slots[::-1].tolist(), char_ids[::-1].tolist())
+    ):
+        # Neighboring cells usually share a color, so write each run of them in one call
+        col_idx = 0
+        for slot, run in itertools.groupby(
+            zip(row_slots, row_chars), key=operator.itemgetter(0)
+        ):
+            text = "".join([CHAR_TABLE[char] for _, char in run])
+            pad.addstr(row_idx, col_idx, text, attrs[slot])
+            col_idx += len(text)
+    pad.overwrite(window, 0, 0, 0, 0, rows - 1, cols - 1)
 
 
 def run_with_stdscr(func) -> None:
@@ -119,6 +149,8 @@ def run_with_stdscr(func) -> None:
     try:
         curses.wrapper(inner)
     finally:
+        # Pads belong to this curses session, so don't hand them to the next one
+        _get_pad.cache_clear()
         if _prev_pythonbreakpoint is not None:
             os.environ["PYTHONBREAKPOINT"] = _prev_pythonbreakpoint
         if token:
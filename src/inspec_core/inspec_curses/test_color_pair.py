@@ -1,10 +1,11 @@
 import curses
 from unittest import mock
 
+import numpy as np
 import pytest
 
 from inspec_core.render import chars
-from inspec_core.render.types import XTermColor
+from inspec_core.render.types import ColoredCharArray, XTermColor
 
 from . import context
 from .color_pair import ColorToSlot
@@ -92,3 +93,30 @@ def test_color_to_slot(mock_curses_colors):
 
     assert char == str(chars.FULL_0)
     assert mock_curses_colors[slot.value][1] == 0
+
+
+def test_convert_array():
+    colors = [XTermColor(0), XTermColor(1), XTermColor(100), XTermColor(255)]
+    color_to_slot = ColorToSlot(colors=colors)
+
+    cells = [
+        (char_id, fg.value, bg.value)
+        for char_id in range(len(chars.CHAR_TABLE))
+        for fg in colors
+        for bg in colors
+    ]
+    char_ids, fgs, bgs = np.array(cells, dtype=np.uint8).T
+    arr = ColoredCharArray(chars=char_ids[None], fg=fgs[None], bg=bgs[None])
+    slots, converted_ids = color_to_slot.convert_array(arr)
+
+    for i, (char_id, fg, bg) in enumerate(cells):
+        slot, char = color_to_slot.convert(
+            chars.CHAR_TABLE[char_id], XTermColor(fg), XTermColor(bg)
+        )
+        assert slots[0, i] == slot.value
+        assert chars.CHAR_TABLE[converted_ids[0, i]] == char
+
+    # XTermColor(2) isn't in the colorset
+    arr.fg[0, 0] = 2
+    with pytest.raises(KeyError):
+        color_to_slot.convert_array(arr)
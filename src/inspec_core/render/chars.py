@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import numpy as np
+from numpy.typing import NDArray
+
 from .types import IChar
 
 FULL_1 = IChar(fg="█", bg=" ")
@@ -26,6 +29,27 @@ QTR_0011 = IChar(fg="▐", bg="▌")
 QTR_1111 = IChar(fg="█", bg=" ")
 
 
+# The quarter characters indexed by their mask packed into 4 bits, first position highest
+QUARTER_CHARS_BY_MASK: tuple[IChar, ...] = (
+    QTR_0000,
+    QTR_0001,
+    QTR_0010,
+    QTR_0011,
+    QTR_0100,
+    QTR_0101,
+    QTR_0110,
+    QTR_0111,
+    QTR_1000,
+    QTR_1001,
+    QTR_1010,
+    QTR_1011,
+    QTR_1100,
+    QTR_1101,
+    QTR_1110,
+    QTR_1111,
+)
+
+
 def get_char(*mask: bool | int) -> IChar:
     """
     Get a character by name by bool <> position
@@ -40,14 +64,45 @@ def get_char(*mask: bool | int) -> IChar:
     elif len(mask) == 2:
         return globals()[f"HALF_{int(mask[0])}{int(mask[1])}"]
     elif len(mask) == 4:
-        return globals()[
-            f"QTR_{int(mask[0])}{int(mask[1])}{int(mask[2])}{int(mask[3])}"
+        # Called once per patch when rendering, so skip building and looking up the name
+        return QUARTER_CHARS_BY_MASK[
+            (bool(mask[0]) << 3)
+            | (bool(mask[1]) << 2)
+            | (bool(mask[2]) << 1)
+            | bool(mask[3])
         ]
     else:
         raise ValueError("Invalid mask")
 
 
+# Every distinct glyph, so that character arrays can store small integer ids instead of
+# IChar objects. A glyph always has the same inverse, so the glyph alone identifies it.
+CHAR_TABLE: tuple[IChar, ...] = tuple(
+    {
+        str(char): char
+        for name, char in list(globals().items())
+        if name.startswith(("FULL_", "HALF_", "QTR_"))
+    }.values()
+)
+_CHAR_IDS: dict[str, int] = {str(char): i for i, char in enumerate(CHAR_TABLE)}
+# The id of each character's inverse, for swapping fg and bg on a whole array at once
+INVERTED_CHAR_IDS: NDArray[np.uint8] = np.array(
+    [_CHAR_IDS[char.inverted_char] for char in CHAR_TABLE], dtype=np.uint8
+)
+
+
+def char_id(char: str) -> int:
+    """
+    Get the index of a character in CHAR_TABLE
+    """
+    return _CHAR_IDS[str(char)]
+
+
 __all__ = [
+    "CHAR_TABLE",
+    "INVERTED_CHAR_IDS",
+    "QUARTER_CHARS_BY_MASK",
+    "char_id",
     "get_char",
     "FULL_1",
     "FULL_0",
@@ -5,15 +5,31 @@ from __future__ import annotations
 
 import abc
 import bisect
+import functools
 from typing import Any, Optional
 
+import numpy as np
 import pydantic
+from numpy.typing import NDArray
 from typing_extensions import Self
 
 from . import x256
 from .types import RGB, Intensity, XTermColor
 
 
+@functools.lru_cache(maxsize=32)
+def _color_value_table(colors: tuple[XTermColor, ...]) -> NDArray[np.uint8]:
+    """
+    Lookup table from a bin index to its xterm color value, shared by maps with equal colors
+
+    Keyed on the colors rather than cached on the map, since model_copy() would carry a
+    cached table over to a copy with different colors.
+    """
+    table = np.array([color.value for color in colors], dtype=np.uint8)
+    table.setflags(write=False)
+    return table
+
+
 class BaseMap(pydantic.BaseModel, abc.ABC):
     colors: tuple[XTermColor, ...]
 
@@ -79,6 +95,32 @@ class IntensityMap(BaseMap):
         """
         return bisect.bisect_left(self.bin_edges, intensity.value)
 
+    def to_bins(self, values: NDArray[np.floating]) -> NDArray[np.intp]:
+        """
+        Apply the intensity map to an array of raw intensity values at once
+
+        Returns indices into self.colors, matching _to_bin() for each element.
+        """
+        # There are only a few dozen edges, so counting the edges each value is above with
+        # one branch-free comparison per edge beats a binary search per value, which
+        # mispredicts constantly on image data. Comparing as float64 keeps it exact, and
+        # counting "not above" from the top sends NaN to the last bin like searchsorted.
+        values = np.asarray(values, dtype=np.float64)
+        at_or_below = np.zeros(values.shape, dtype=np.uint16)
+        mask = np.empty(values.shape, dtype=bool)
+        for edge in self.bin_edges:
+            np.less_equal(values, edge, out=mask)
+            at_or_below += mask
+        return len(self.bin_edges) - at_or_below.astype(np.intp)
+
+    def to_color_values(self, values: NDArray[np.floating]) -> NDArray[np.uint8]:
+        """
+        Apply the intensity map to an array of raw intensity values at once
+
+        Returns the xterm color value for each element.
+        """
+        return _color_value_table(self.colors)[self.to_bins(values)]
+
     def to_color(self, intensity: Intensity) -> XTermColor:
         """
         Apply the intensity map to a single intensity value
@@ -124,6 +166,24 @@ class RGBMap(BaseMap):
             rgb = RGB(255 - rgb.r, 255 - rgb.g, 255 - rgb.b)
         return x256.to_xterm(rgb.r, rgb.g, rgb.b)
 
+    def to_bins(self, rgb: NDArray[np.integer]) -> NDArray[np.intp]:
+        """
+        Apply the map to an array of RGB values (with a trailing axis of length 3) at once
+
+        Returns indices into self.colors, matching _to_bin() for each pixel.
+        """
+        if self._inverted:
+            rgb = 255 - rgb.astype(np.int64)
+        return x256.to_xterm_arr(rgb)
+
+    def to_color_values(self, rgb: NDArray[np.integer]) -> NDArray[np.uint8]:
+        """
+        Apply the map to an array of RGB values (with a trailing axis of length 3) at once
+
+        Returns the xterm color value for each pixel.
+        """
+        return _color_value_table(self.colors)[self.to_bins(rgb)]
+
     def to_color(self, rgb: RGB) -> XTermColor:
         """
         Apply the intensity map to a single intensity value
@@ -1,19 +1,39 @@
-from .types import ColoredChar, ColoredCharArray, XTermColor
+import numpy as np
 
+from .chars import CHAR_TABLE
+from .types import ColoredCharArray
 
-def _ansi_set_color_str(fg_color: XTermColor, bg_color: XTermColor) -> str:
-    return f"\u001b[38;5;{fg_color.value}m\u001b[48;5;{bg_color.value}m"
+# Escape sequences for every xterm color, so they are formatted once instead of per cell
+_ANSI_FG = [f"\u001b[38;5;{color}m" for color in range(256)]
+_ANSI_BG = [f"\u001b[48;5;{color}m" for color in range(256)]
+
+
+def _ansi_set_color_str(fg_color: int, bg_color: int) -> str:
+    return _ANSI_FG[fg_color] + _ANSI_BG[bg_color]
 
 
 def display(arr: ColoredCharArray, end: str = "\n") -> None:
     ansi_reset_str = "\u001b[0m"
-    last = len(arr) - 1
-    for i, row in enumerate(arr[::-1]):
+
+    # Find where the colors change from the previous cell in each row all at once; an
+    # escape sequence is only emitted at the start of each run of same-colored cells
+    fg = arr.fg[::-1]
+    bg = arr.bg[::-1]
+    run_starts = np.ones(fg.shape, dtype=bool)
+    run_starts[:, 1:] = (fg[:, 1:] != fg[:, :-1]) | (bg[:, 1:] != bg[:, :-1])
+
+    lines = []
+    for chars, fgs, bgs, starts in zip(
+        arr.chars[::-1].tolist(), fg.tolist(), bg.tolist(), run_starts
+    ):
+        text = "".join([CHAR_TABLE[char] for char in chars])
+        bounds = np.flatnonzero(starts).tolist() + [len(text)]
         parts = []
-        for char_with_color in row:
-            char_with_color: ColoredChar
-            parts.append(
-                _ansi_set_color_str(char_with_color.color.fg, char_with_color.color.bg)
-                + char_with_color.char
-            )
-        print("".join(parts) + ansi_reset_str, end="\n" if i != last else end)
+        for start, stop in zip(bounds[:-1], bounds[1:]):
+            parts.append(_ansi_set_color_str(fgs[start], bgs[start]))
+            parts.append(text[start:stop])
+        lines.append("".join(parts) + ansi_reset_str)
+
+    # Hand the whole frame to stdout at once rather than writing it row by row
+    if lines:
+        print("\n".join(lines), end=end)
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import abc
-import warnings
 from dataclasses import dataclass
 from typing import Generic, Iterator, TypeVar
 
@@ -14,10 +13,9 @@ from .colors import IntensityMap, RGBMap
 from .types import RGB, CharShape, ColoredChar, ColoredCharArray, ColorPair, Intensity
 
 InputT = TypeVar("InputT", covariant=True)
-_WARN_IMAGE_SIZE = 100_000
 
 
-@dataclass
+@dataclass(slots=True)
 class Patch(Generic[InputT]):
     row: int
     col: int
@@ -60,6 +58,23 @@ class PatchRenderer(Renderer[InputT], abc.ABC):
             height=self._patch_dimensions[0],
         )
 
+    def patches_view(self, image: NDArray) -> NDArray:
+        """
+        View an image as a grid of patches, without copying it
+
+        Returns an array of shape (output rows, output cols, patch rows, patch cols, ...).
+        Rows and columns that don't fill a whole patch are left off.
+        """
+        patch_rows, patch_cols = self._patch_dimensions
+        rows = image.shape[0] // patch_rows
+        cols = image.shape[1] // patch_cols
+        # Splitting an axis in two never needs a copy, even for a sliced (strided) image
+        return (
+            image[: rows * patch_rows, : cols * patch_cols]
+            .reshape(rows, patch_rows, cols, patch_cols, *image.shape[2:])
+            .swapaxes(1, 2)
+        )
+
     def iter_patches(self, image: NDArray) -> Iterator[Patch[InputT]]:
         """
         Iterate over patches of 2D image array given the patch dimension.
@@ -68,52 +83,53 @@ class PatchRenderer(Renderer[InputT], abc.ABC):
 
         The order is not guaranteed.
         """
-        # if (
-        #     image.shape[0] % self._patch_dimensions[0]
-        #     or image.shape[1] % self._patch_dimensions[1]
-        # ):
-        #     raise ValueError(
-        #         "Image to convert to characters must be a even multiple of patch size"
-        #     )
-
-        # Unpad the image to be a multiple of the patch size
-        slice_off_rows = image.shape[0] % self._patch_dimensions[0]
-        slice_off_cols = image.shape[1] % self._patch_dimensions[1]
-
-        rows, cols = image.shape
-        for output_row_idx, input_row_idx in enumerate(
-            range(rows)[: -slice_off_rows or None : self._patch_dimensions[0]]
-        ):
-            for output_col_idx, input_col_idx in enumerate(
-                range(cols)[: -slice_off_cols or None : self._patch_dimensions[1]]
-            ):
-                yield Patch(
-                    row=output_row_idx,
-                    col=output_col_idx,
-                    arr=image[
-                        slice(input_row_idx, input_row_idx + self._patch_dimensions[0]),
-                        slice(input_col_idx, input_col_idx + self._patch_dimensions[1]),
-                    ],
-                )
+        patches = self.patches_view(image)
+        for row in range(patches.shape[0]):
+            for col in range(patches.shape[1]):
+                yield Patch(row=row, col=col, arr=patches[row, col])
 
     def apply(self, image: NDArray) -> ColoredCharArray:  # type: ignore
         """
         Convert an image array into colorized characters.
         """
-        slice_off_rows = image.shape[0] % self._patch_dimensions[0]
-        slice_off_cols = image.shape[1] % self._patch_dimensions[1]
-        output_shape = (
-            (image.shape[0] - slice_off_rows) // self._patch_dimensions[0],
-            (image.shape[1] - slice_off_cols) // self._patch_dimensions[1],
-        )
-
-        char_array = np.empty(output_shape, dtype=object)
+        char_array = ColoredCharArray.empty(self.patches_view(image).shape[:2])
         for patch in self.iter_patches(image):
-            char_array[patch.row, patch.col] = self.patch_to_char(patch)
+            char = self.patch_to_char(patch)
+            char_array.chars[patch.row, patch.col] = chars.char_id(char.char)
+            char_array.fg[patch.row, patch.col] = char.color.fg.value
+            char_array.bg[patch.row, patch.col] = char.color.bg.value
 
         return char_array
 
 
+def _intensity_values(image: NDArray) -> NDArray[np.float32]:
+    """
+    Unwrap an array of Intensity objects (or pass through an array of floats)
+    """
+    if image.dtype == object:
+        return np.vectorize(lambda i: i.value, otypes=[np.float32])(image)
+    return np.asarray(image, dtype=np.float32)
+
+
+def _rgb_values(image: NDArray) -> NDArray:
+    """
+    Unwrap an array of RGB objects into an array with a trailing axis of length 3 (or pass
+    through an array that is already in that form)
+    """
+    if image.dtype == object:
+        return np.stack(
+            np.vectorize(lambda c: (c.r, c.g, c.b), otypes=[np.uint8] * 3)(image),
+            axis=-1,
+        )
+    return np.asarray(image)
+
+
+# The character id for each quarter mask, packed into 4 bits in get_char's argument order
+_QTR_CHAR_IDS: NDArray[np.uint8] = np.array(
+    [chars.char_id(char) for char in chars.QUARTER_CHARS_BY_MASK], dtype=np.uint8
+)
+
+
 class FullCharRenderer(PatchRenderer[InputT], abc.ABC):
     _patch_dimensions: tuple[int, int] = (1, 1)
 
@@ -141,6 +157,15 @@ class FullCharIntensityRenderer(FullCharRenderer[Intensity]):
             ),
         )
 
+    def apply(self, image: NDArray) -> ColoredCharArray:
+        # Bin every value at once rather than going through patch_to_char() for each cell
+        colors = self.intensity_map.to_color_values(_intensity_values(image))
+        return ColoredCharArray(
+            chars=np.full(colors.shape, chars.char_id(chars.FULL_1), dtype=np.uint8),
+            fg=colors,
+            bg=colors,
+        )
+
 
 @dataclass
 class HalfCharIntensityRenderer(HalfCharRenderer[Intensity]):
@@ -159,6 +184,18 @@ class HalfCharIntensityRenderer(HalfCharRenderer[Intensity]):
             ),
         )
 
+    def apply(self, image: NDArray) -> ColoredCharArray:
+        # Bin every value at once rather than going through patch_to_char() for each cell
+        values = _intensity_values(image[: image.shape[0] - image.shape[0] % 2])
+        colors = self.intensity_map.to_color_values(values)
+        return ColoredCharArray(
+            chars=np.full(
+                colors[0::2].shape, chars.char_id(chars.HALF_10), dtype=np.uint8
+            ),
+            fg=colors[0::2],
+            bg=colors[1::2],
+        )
+
 
 @dataclass
 class QuarterCharIntensityRenderer(QuarterCharRenderer[Intensity]):
@@ -170,15 +207,17 @@ class QuarterCharIntensityRenderer(QuarterCharRenderer[Intensity]):
 
         Avoids using slower numpy operations for means and such
         """
+        # The patch may hold Intensity objects or (from apply) their raw float values
+        values = _intensity_values(patch.arr)
         flat_patch = (
-            patch.arr[0, 0],
-            patch.arr[0, 1],
-            patch.arr[1, 0],
-            patch.arr[1, 1],
+            values[0, 0],
+            values[0, 1],
+            values[1, 0],
+            values[1, 1],
         )
-        flat_patch: tuple[Intensity, Intensity, Intensity, Intensity]
-        patch_mean = sum([intensity.value for intensity in flat_patch]) / 4
-        mask = [p.value > patch_mean for p in flat_patch]
+        flat_patch: tuple[float, float, float, float]
+        patch_mean = sum(flat_patch) / 4
+        mask = [p > patch_mean for p in flat_patch]
 
         # We can only pick two intensity values for the patch, for the fg and bg.
         # We'll average the values of the pixels that are above the mean for the fg,
@@ -196,10 +235,8 @@ class QuarterCharIntensityRenderer(QuarterCharRenderer[Intensity]):
         elif count == 4:
             raise RuntimeError("This should never happen")
 
-        fg_mean = sum([p.value for p in flat_patch if p.value > patch_mean]) / count
-        bg_mean = sum([p.value for p in flat_patch if p.value <= patch_mean]) / (
-            4 - count
-        )
+        fg_mean = sum([p for p in flat_patch if p > patch_mean]) / count
+        bg_mean = sum([p for p in flat_patch if p <= patch_mean]) / (4 - count)
 
         return ColoredChar(
             char=chars.get_char(*mask),
@@ -209,6 +246,47 @@ class QuarterCharIntensityRenderer(QuarterCharRenderer[Intensity]):
             ),
         )
 
+    def apply(self, image: NDArray) -> ColoredCharArray:
+        """
+        Same as applying patch_to_char() to every patch, but computed for all of them at once
+        """
+        patches = self.patches_view(_intensity_values(image))
+        # The four pixels of each patch, in the same order as patch_to_char's flat_patch.
+        # Sums are accumulated in that order too, so the float32 rounding matches exactly
+        flat_patch = (
+            patches[..., 0, 0],
+            patches[..., 0, 1],
+            patches[..., 1, 0],
+            patches[..., 1, 1],
+        )
+        patch_mean = ((flat_patch[0] + flat_patch[1]) + flat_patch[2]) + flat_patch[3]
+        patch_mean /= np.float32(4)
+        mask = [p > patch_mean for p in flat_patch]
+
+        count = np.zeros(patch_mean.shape, dtype=np.float32)
+        fg_sum = np.zeros(patch_mean.shape, dtype=np.float32)
+        bg_sum = np.zeros(patch_mean.shape, dtype=np.float32)
+        char_idx = np.zeros(patch_mean.shape, dtype=np.intp)
+        for p, m in zip(flat_patch, mask):
+            count += m
+            fg_sum += np.where(m, p, np.float32(0))
+            bg_sum += np.where(m, np.float32(0), p)
+            char_idx = (char_idx << 1) | m
+
+        # Where every value equals the mean (count == 0, or 4 if rounding puts the mean just
+        # below them), both colors are the mean
+        uniform = (count == 0) | (count == 4)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            fg_mean = np.where(uniform, patch_mean, fg_sum / count)
+            bg_mean = np.where(uniform, patch_mean, bg_sum / (np.float32(4) - count))
+        char_idx[uniform] = 0
+
+        return ColoredCharArray(
+            chars=_QTR_CHAR_IDS[char_idx],
+            fg=self.intensity_map.to_color_values(fg_mean),
+            bg=self.intensity_map.to_color_values(bg_mean),
+        )
+
 
 @dataclass
 class FullCharRGBRenderer(FullCharRenderer[RGB]):
@@ -226,11 +304,13 @@ class FullCharRGBRenderer(FullCharRenderer[RGB]):
         )
 
     def apply(self, image: NDArray) -> ColoredCharArray:
-        if image.shape[0] * image.shape[1] > _WARN_IMAGE_SIZE:
-            warnings.warn(
-                f"Rendering large image of shape {image.shape}, this may take a while"
-            )
-        return super().apply(image)
+        # Match every pixel to the palette at once rather than going through patch_to_char()
+        colors = self.rgb_map.to_color_values(_rgb_values(image))
+        return ColoredCharArray(
+            chars=np.full(colors.shape, chars.char_id(chars.FULL_1), dtype=np.uint8),
+            fg=colors,
+            bg=colors,
+        )
 
 
 @dataclass
@@ -251,11 +331,16 @@ class HalfCharRGBRenderer(HalfCharRenderer[RGB]):
         )
 
     def apply(self, image: NDArray) -> ColoredCharArray:
-        if image.shape[0] * image.shape[1] > _WARN_IMAGE_SIZE:
-            warnings.warn(
-                f"Rendering large image of shape {image.shape}, this may take a while"
-            )
-        return super().apply(image)
+        # Match every pixel to the palette at once rather than going through patch_to_char()
+        rgb = _rgb_values(image[: image.shape[0] - image.shape[0] % 2])
+        colors = self.rgb_map.to_color_values(rgb)
+        return ColoredCharArray(
+            chars=np.full(
+                colors[0::2].shape, chars.char_id(chars.HALF_10), dtype=np.uint8
+            ),
+            fg=colors[0::2],
+            bg=colors[1::2],
+        )
 
 
 def make_intensity_renderer(
@@ -4,6 +4,7 @@ from inspec_core.colormaps import get_colormap
 
 from . import make_intensity_renderer, make_rgb_renderer
 from .display import display
+from .renderer import PatchRenderer
 from .types import RGB, CharShape, Intensity
 
 
@@ -26,6 +27,50 @@ def test_display_rgb():
     display(renderer.apply(arr))
 
 
+def test_vectorized_intensity_renderers():
+    values = np.random.rand(41, 40)
+    values[0, :4] = [0.0, 1.0, 0.5, 0.25]  # Include values exactly on bin edges
+    arr = np.vectorize(Intensity)(values)
+    cmap = get_colormap("viridis")
+    for shape in (CharShape.Full, CharShape.Half):
+        renderer = make_intensity_renderer(cmap, shape=shape)
+        assert isinstance(renderer, PatchRenderer)
+        expected = PatchRenderer.apply(renderer, arr)
+        for result in (renderer.apply(arr), renderer.apply(values)):
+            np.testing.assert_array_equal(result.chars, expected.chars)
+            np.testing.assert_array_equal(result.fg, expected.fg)
+            np.testing.assert_array_equal(result.bg, expected.bg)
+
+
+def test_vectorized_quarter_renderer():
+    values = np.random.rand(41, 39).astype(np.float32)
+    values[:2, :2] = 0.3  # A uniform patch
+    values[2:4, :2] = [[0.0, 1.0], [0.5, 0.25]]  # Include values exactly on bin edges
+    renderer = make_intensity_renderer(get_colormap("viridis"), shape=CharShape.Quarter)
+    assert isinstance(renderer, PatchRenderer)
+    expected = PatchRenderer.apply(renderer, values)
+    for result in (
+        renderer.apply(values),
+        renderer.apply(np.vectorize(Intensity)(values)),
+    ):
+        np.testing.assert_array_equal(result.chars, expected.chars)
+        np.testing.assert_array_equal(result.fg, expected.fg)
+        np.testing.assert_array_equal(result.bg, expected.bg)
+
+
+def test_vectorized_rgb_renderers():
+    values = np.random.choice(256, size=(41, 40, 3)).astype(np.uint8)
+    arr = np.vectorize(to_rgb, signature="(n) -> ()")(values)
+    for shape in (CharShape.Full, CharShape.Half):
+        renderer = make_rgb_renderer(shape=shape)
+        assert isinstance(renderer, PatchRenderer)
+        expected = PatchRenderer.apply(renderer, arr)
+        for result in (renderer.apply(arr), renderer.apply(values)):
+            np.testing.assert_array_equal(result.chars, expected.chars)
+            np.testing.assert_array_equal(result.fg, expected.fg)
+            np.testing.assert_array_equal(result.bg, expected.bg)
+
+
 if __name__ == "__main__":
     test_display()
     test_display_rgb()
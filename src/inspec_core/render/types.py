@@ -3,6 +3,7 @@ from __future__ import annotations
 import enum
 from dataclasses import dataclass
 
+import numpy as np
 from numpy.typing import NDArray
 
 
@@ -42,7 +43,7 @@ class CharShape(str, enum.Enum):
     Quarter = "quarter"
 
 
-@dataclass
+@dataclass(slots=True)
 class XTermColor:
     """
     Represents one of the 256 colors in xterm-256color palette
@@ -58,7 +59,7 @@ class XTermColor:
         return hash(self.value)
 
 
-@dataclass
+@dataclass(slots=True)
 class Intensity:
     """
     Represents a grey-scale color from 0 to 1.
@@ -70,7 +71,7 @@ class Intensity:
         assert 0 <= self.value <= 1
 
 
-@dataclass
+@dataclass(slots=True)
 class RGB:
     """
     Represents an RGB color from 0 to 1.
@@ -86,16 +87,42 @@ class RGB:
         assert 0 <= self.b <= 255
 
 
-@dataclass
+@dataclass(slots=True)
 class ColorPair:
     fg: XTermColor
     bg: XTermColor
 
 
-@dataclass
+@dataclass(slots=True)
 class ColoredChar:
     char: IChar
     color: ColorPair
 
 
-ColoredCharArray = NDArray[ColoredChar]  # type: ignore
+@dataclass(eq=False)
+class ColoredCharArray:
+    """
+    A 2D array of colored characters, stored as one homogeneous array per field
+
+    chars holds indices into render.chars.CHAR_TABLE, and fg and bg hold xterm-256 color
+    values, so the whole array can be built and consumed with numpy operations.
+    """
+
+    chars: NDArray[np.uint8]
+    fg: NDArray[np.uint8]
+    bg: NDArray[np.uint8]
+
+    @staticmethod
+    def empty(shape: tuple[int, int]) -> ColoredCharArray:
+        return ColoredCharArray(
+            chars=np.zeros(shape, dtype=np.uint8),
+            fg=np.zeros(shape, dtype=np.uint8),
+            bg=np.zeros(shape, dtype=np.uint8),
+        )
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return self.chars.shape
+
+    def __len__(self) -> int:
+        return len(self.chars)
@@ -263,6 +263,12 @@ _XTERM_COLORS_AS_RGB = np.array(
 )
 
 
+_XTERM_SQUARED_NORMS = np.sum(_XTERM_COLORS_AS_RGB**2, axis=1)
+
+# Number of distinct colors matched against the palette at a time in to_xterm_arr()
+_BLOCK_SIZE = 4096
+
+
 def to_xterm_arr(arr: NDArray) -> NDArray:
     """
     Convert an array of RGB values to xterm-256color values
@@ -274,10 +280,21 @@ def to_xterm_arr(arr: NDArray) -> NDArray:
     """
     assert arr.ndim == 3
     assert arr.shape[-1] == 3
-    response: NDArray = np.argmin(
-        np.linalg.norm(arr - _XTERM_COLORS_AS_RGB, axis=2), axis=1
-    )
-    assert response.shape == arr.shape[:-1]
+    # Images tend to repeat colors, so only search the palette once per distinct color
+    flat = arr.reshape(-1, 3).astype(np.int64)
+    packed = (flat[:, 0] << 16) | (flat[:, 1] << 8) | flat[:, 2]
+    unique, inverse = np.unique(packed, return_inverse=True)
+    unique_rgb = np.stack([unique >> 16, (unique >> 8) & 255, unique & 255], axis=1)
+
+    nearest = np.empty(len(unique), dtype=np.intp)
+    for start in range(0, len(unique), _BLOCK_SIZE):
+        block = unique_rgb[start : start + _BLOCK_SIZE]
+        # |p - c|^2 = |p|^2 - 2 p.c + |c|^2, and |p|^2 doesn't change which c is closest.
+        # Everything stays in exact integers, so ties resolve the same way as to_xterm()
+        distance = _XTERM_SQUARED_NORMS - 2 * (block @ _XTERM_COLORS_AS_RGB.T)
+        nearest[start : start + _BLOCK_SIZE] = np.argmin(distance, axis=1)
+
+    response: NDArray = nearest[inverse.reshape(-1)].reshape(arr.shape[:-1])
     return response
 
 
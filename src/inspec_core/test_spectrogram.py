@@ -1,6 +1,11 @@
 import numpy as np
 
-from inspec_core.audio_utils import _get_frequencies, compute_spectrogram, resize
+from inspec_core.audio_utils import (
+    _get_frequencies,
+    compute_spectrogram,
+    resize,
+    resize_1d,
+)
 
 
 def test_get_frequencies():
@@ -33,6 +38,14 @@ def test_spectrogram():
     assert f[-1] < 10000
 
 
+def test_spectrogram_hop_uneven_rates():
+    # 44100 / 840 = 52.5 doesn't divide evenly; the hop rounds to 53 samples
+    signal = np.random.random(100_000)
+    t, f, spec = compute_spectrogram(signal, 44100, 840, 50)
+    assert spec.shape[1] == 100_000 // 53
+    np.testing.assert_allclose(t[1] - t[0], 53 / 44100)
+
+
 def test_resize_smaller():
     x = np.array(
         [
@@ -82,3 +95,15 @@ def test_resize_realistic_size():
     x = np.random.random((200, 6000))
     x_ = resize(x, (40, 160))
     assert x_.shape == (40, 160)
+
+
+def test_resize_1d():
+    x = np.random.random(100)
+    for output_len in (1, 7, 100, 250):
+        expected = np.interp(
+            np.linspace(0, len(x), output_len), np.linspace(0, len(x), len(x)), x
+        )
+        np.testing.assert_allclose(resize_1d(x, output_len), expected, rtol=1e-6)
+
+    np.testing.assert_array_equal(resize_1d(np.array([1.0, 2.0]), 3), [1.0, 1.5, 2.0])
+    np.testing.assert_array_equal(resize_1d(np.array([3.0]), 2), [3.0, 3.0])